@@ -1,11 +1,20 @@
+import hashlib
+import itertools
 import os
+import time
+import uuid
 from fastapi import FastAPI, Request, Form, HTTPException, Query
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import create_engine, text
+from sqlalchemy import JSON, make_url, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from pydantic import BaseModel
 from typing import Optional
 from urllib.parse import urlencode 
 from fastapi.staticfiles import StaticFiles
+from cachetools import TTLCache
+from jinja2 import FileSystemBytecodeCache
 
 # --- League config ---
 EVENTS_13 = [
@@ -41,42 +50,245 @@ EVENTS_ORDERED = [
 ]
 
 
-ALLOWED_ROUNDS = ["W", "F", "SF", "QF", "R16", "R32", "R64", "R128"]
+ALLOWED_ROUNDS = ("W", "F", "SF", "QF", "R16", "R32", "R64", "R128")  # display order
+_ALLOWED_ROUNDS_SET = frozenset(ALLOWED_ROUNDS)  # membership checks
 
 # You can tune these later; Slams will use R128 sometimes, Masters usually won't.
 POINTS = {"W": 100, "F": 60, "SF": 40, "QF": 25, "R16": 15, "R32": 8, "R64": 4, "R128": 2}
 
+MEDALS = {1: "🥇", 2: "🥈", 3: "🥉"}
+
 # --- Environment ---
 DATABASE_URL = os.environ["DATABASE_URL"]  # Supabase/Render Postgres URL
 LEAGUE_YEAR = int(os.environ.get("LEAGUE_YEAR", "2026"))
 COMMISSIONER_KEY = os.environ.get("COMMISSIONER_KEY", "")
-
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
-app = FastAPI()
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# Set SERVE_STATIC=0 when a reverse proxy/CDN serves /static/ (see README)
+SERVE_STATIC = os.environ.get("SERVE_STATIC", "1") == "1"
+
+# Connection pool, per worker process: keep workers * (size + overflow) under the
+# database's max_connections. Connections are recycled instead of pinged on every
+# checkout; set DB_POOL_PRE_PING=1 if the platform drops idle sockets.
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "20"))
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "0") == "1"
+# Set DB_TRANSACTION_POOLER=1 when DATABASE_URL goes through a transaction-mode pooler
+# (pgbouncer, Supabase's pooler on :6543): server connections are shared between
+# clients, so named prepared statements must not be cached or reused.
+DB_TRANSACTION_POOLER = os.environ.get("DB_TRANSACTION_POOLER", "0") == "1"
+
+
+def async_database_url(url: str):
+    """Points a Postgres URL (postgres://, postgresql+psycopg2://, ...) at the asyncpg driver."""
+    u = make_url(url).set(drivername="postgresql+asyncpg")
+    # asyncpg spells libpq's sslmode as ssl
+    if "sslmode" in u.query:
+        u = u.difference_update_query(["sslmode"]).update_query_dict({"ssl": u.query["sslmode"]})
+    # Room for every hot-path statement, unless a transaction-mode pooler rules caching out
+    if "prepared_statement_cache_size" not in u.query:
+        cache_size = "0" if DB_TRANSACTION_POOLER else "500"
+        u = u.update_query_dict({"prepared_statement_cache_size": cache_size})
+    return u
+
+
+def pooler_connect_args() -> dict:
+    """asyncpg settings that keep prepared statements working behind a transaction-mode pooler."""
+    if not DB_TRANSACTION_POOLER:
+        return {}
+    return {
+        # asyncpg's own statement cache, separate from SQLAlchemy's
+        "statement_cache_size": 0,
+        # Unique names so statements from different clients never collide on a shared backend
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    }
+
+
+engine = create_async_engine(
+    async_database_url(DATABASE_URL),
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    connect_args=pooler_connect_args(),
+)
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers keep assets for a week."""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=604800"
+        return response
+
+
+app = FastAPI(default_response_class=ORJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=500)
+if SERVE_STATIC:
+    app.mount("/static", CachedStaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
-
-
-def init_db() -> None:
+# Reuse compiled template bytecode across workers/restarts (keyed by source checksum),
+# and skip per-render mtime checks unless TEMPLATE_AUTO_RELOAD=1 (local template editing).
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+templates.env.auto_reload = os.environ.get("TEMPLATE_AUTO_RELOAD") == "1"
+
+# Per-process caches keyed by LEAGUE_YEAR; writes in this process clear them,
+# the TTL bounds staleness when several workers share the database.
+_events_cache = TTLCache(maxsize=4, ttl=3600)
+_people_cache = TTLCache(maxsize=4, ttl=60)
+
+# Rendered home page and its ETag, keyed by (LEAGUE_YEAR, _VERSION). Every write bumps
+# _VERSION; the short TTL covers writes that landed in another worker.
+HOME_CACHE_TTL = 5
+_home_cache = TTLCache(maxsize=4, ttl=HOME_CACHE_TTL)
+_version_counter = itertools.count(1)
+_VERSION = 0
+
+
+def _bump_version() -> None:
+    global _VERSION
+    _VERSION = next(_version_counter)
+
+
+# Page ETags: the boot id keeps a restarted worker from matching old tags, and the
+# time window bounds staleness from writes that landed in another worker. It must not
+# exceed HOME_CACHE_TTL, or 304s would outlive the staleness bound the caches promise.
+_BOOT_ID = uuid.uuid4().hex[:8]
+ETAG_WINDOW = HOME_CACHE_TTL
+
+
+def _etag() -> str:
+    return f'W/"{LEAGUE_YEAR}-{_BOOT_ID}-{_VERSION}-{int(time.time()) // ETAG_WINDOW}"'
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Returns a 304 when the browser's cached copy is still current."""
+    tags = [t.strip() for t in request.headers.get("if-none-match", "").split(",")]
+    if etag in tags:
+        return _with_etag(Response(status_code=304), etag)
+    return None
+
+
+def _with_etag(response: Response, etag: str) -> Response:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, max-age=0, must-revalidate"
+    return response
+
+
+# --- Hot-path SQL ---
+# Built once at import so each statement's text is stable: SQLAlchemy reuses its
+# compiled form and asyncpg reuses the server-side prepared statement per connection.
+SQL_PEOPLE = text("SELECT name FROM people ORDER BY name;")
+
+SQL_EVENTS = text("SELECT id, short_id, name, level FROM events WHERE year=:y ORDER BY id;")
+
+SQL_TOTALS = text("""
+    SELECT person_name AS person, total,
+           RANK() OVER (ORDER BY total DESC) AS rnk
+    FROM mv_person_totals
+    WHERE year = :year
+    ORDER BY rnk, person ASC;
+""")
+
+# One row per event with its picks already grouped into a JSON array
+SQL_BREAKDOWN = text("""
+    SELECT event_id, short_id, name,
+           json_agg(json_build_object(
+               'person', person_name,
+               'player', player_name,
+               'round', COALESCE(NULLIF(round_reached, ''), '—'),
+               'points', pts
+           ) ORDER BY person_name) AS rows
+    FROM mv_event_breakdown
+    WHERE year = :year
+    GROUP BY event_id, short_id, name, sort_order
+    ORDER BY sort_order ASC;
+""").columns(rows=JSON)
+
+SQL_STANDINGS_LOCK = text("SELECT pg_advisory_xact_lock(:k);")
+SQL_REFRESH_TOTALS = text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_person_totals;")
+SQL_REFRESH_BREAKDOWN = text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_event_breakdown;")
+
+SQL_ADD_PERSON = text("INSERT INTO people(name) VALUES (:n) ON CONFLICT (name) DO NOTHING;")
+
+SQL_UPSERT_PICK = text("""
+    INSERT INTO predictions(event_id, person_name, player_name)
+    VALUES (:e, :p, :pl)
+    ON CONFLICT (event_id, person_name)
+    DO UPDATE SET player_name = excluded.player_name;
+""")
+
+SQL_UPSERT_RESULT = text("""
+    INSERT INTO results(event_id, player_name, round_reached)
+    VALUES (:e, :pl, :r)
+    ON CONFLICT (event_id, player_name)
+    DO UPDATE SET round_reached = excluded.round_reached;
+""")
+
+# Serializes init_db across workers starting at the same time (any constant bigint)
+INIT_DB_LOCK_KEY = 7_260_001
+# Serializes standings refreshes so each one snapshots after the previous writer commits
+STANDINGS_LOCK_KEY = 7_260_002
+
+# Standings materialized views. Unique indexes are required for REFRESH ... CONCURRENTLY.
+STANDINGS_VIEWS_DDL = (
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_person_totals AS
+    SELECT e.year, p.person_name,
+           COALESCE(SUM(rp.pts), 0) AS total
+    FROM predictions p
+    JOIN events e ON e.id = p.event_id
+    LEFT JOIN results r
+      ON r.event_id = p.event_id
+     AND r.player_name = p.player_name
+    LEFT JOIN round_points rp ON rp.round_reached = r.round_reached
+    GROUP BY e.year, p.person_name;
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS mv_person_totals_pk ON mv_person_totals (year, person_name);",
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_event_breakdown AS
+    SELECT e.year, e.sort_order, e.id AS event_id, e.short_id, e.name,
+           p.person_name, p.player_name,
+           COALESCE(r.round_reached, '') AS round_reached,
+           COALESCE(rp.pts, 0) AS pts
+    FROM predictions p
+    JOIN events e ON e.id = p.event_id
+    LEFT JOIN results r
+      ON r.event_id = p.event_id
+     AND r.player_name = p.player_name
+    LEFT JOIN round_points rp ON rp.round_reached = r.round_reached;
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS mv_event_breakdown_pk ON mv_event_breakdown (event_id, person_name);",
+)
+# Stored in schema_meta; any edit to the DDL above makes init_db rebuild the views once
+STANDINGS_VIEWS_VERSION = hashlib.sha256("".join(STANDINGS_VIEWS_DDL).encode()).hexdigest()[:16]
+
+
+async def init_db() -> None:
     """Creates tables and seeds events once."""
-    with engine.begin() as conn:
-        conn.execute(text("""
+    async with engine.begin() as conn:
+        # Held until commit: workers booting together run the DDL/seed one at a time
+        # instead of deadlocking on each other's table locks.
+        await conn.execute(text("SELECT pg_advisory_xact_lock(:k);"), {"k": INIT_DB_LOCK_KEY})
+
+        await conn.execute(text("""
         CREATE TABLE IF NOT EXISTS people (
           name TEXT PRIMARY KEY
         );
         """))
 
-        conn.execute(text("""
+        await conn.execute(text("""
         CREATE TABLE IF NOT EXISTS events (
           id TEXT PRIMARY KEY,         -- e.g., AO2026
           short_id TEXT NOT NULL,      -- AO
           name TEXT NOT NULL,
           level TEXT NOT NULL,
+          sort_order INT NOT NULL,     -- calendar order within the season
           year INT NOT NULL
         );
         """))
 
-        conn.execute(text("""
+        await conn.execute(text("""
         CREATE TABLE IF NOT EXISTS predictions (
           event_id TEXT NOT NULL,
           person_name TEXT NOT NULL,
@@ -87,7 +299,7 @@ def init_db() -> None:
         );
         """))
 
-        conn.execute(text("""
+        await conn.execute(text("""
         CREATE TABLE IF NOT EXISTS results (
           event_id TEXT NOT NULL,
           player_name TEXT NOT NULL,
@@ -97,10 +309,67 @@ def init_db() -> None:
         );
         """))
 
-        # Seed 13 events for the configured year
-        for idx, (short_id, name, level) in enumerate(EVENTS_ORDERED, start=1):
-            event_id = f"{short_id}{LEAGUE_YEAR}"
-            conn.execute(text("""
+        # Covering indexes for the standings join (results is covered by its primary key)
+        await conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_predictions_event_person
+          ON predictions (event_id, person_name) INCLUDE (player_name);
+        """))
+        await conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_events_year
+          ON events (year) INCLUDE (id, short_id, name, level, sort_order);
+        """))
+
+        # Points per round live in a lookup table so scoring is a plain JOIN
+        await conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS round_points (
+          round_reached TEXT PRIMARY KEY,
+          pts INT NOT NULL
+        );
+        """))
+        # Bookkeeping for derived objects (e.g. which standings-view definition is live)
+        await conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS schema_meta (
+          key TEXT PRIMARY KEY,
+          value TEXT NOT NULL
+        );
+        """))
+
+        # Only write seed data that differs, so a routine restart takes no row locks
+        # and leaves the standings views alone.
+        inputs_changed = False
+
+        result = await conn.execute(text("SELECT round_reached, pts FROM round_points;"))
+        if dict(result.fetchall()) != POINTS:
+            await conn.execute(text("""
+                INSERT INTO round_points (round_reached, pts)
+                VALUES (:round_reached, :pts)
+                ON CONFLICT (round_reached) DO UPDATE SET pts = EXCLUDED.pts;
+            """), [{"round_reached": rnd, "pts": pts} for rnd, pts in POINTS.items()])
+            await conn.execute(
+                text("DELETE FROM round_points WHERE round_reached <> ALL(:rounds);"),
+                {"rounds": list(POINTS)}
+            )
+            inputs_changed = True
+
+        # Seed 13 events for the configured year in one executemany round-trip
+        seed = [
+            {
+                "id": f"{short_id}{LEAGUE_YEAR}",
+                "short_id": short_id,
+                "name": name,
+                "level": level,
+                "sort_order": idx,
+                "year": LEAGUE_YEAR
+            }
+            for idx, (short_id, name, level) in enumerate(EVENTS_ORDERED, start=1)
+        ]
+        result = await conn.execute(
+            text("SELECT id, short_id, name, level, sort_order, year FROM events WHERE year=:y;"),
+            {"y": LEAGUE_YEAR}
+        )
+        existing = {tuple(r) for r in result.fetchall()}
+        if not {tuple(row.values()) for row in seed} <= existing:
+            await conn.execute(text("""
                 INSERT INTO events (id, short_id, name, level, sort_order, year)
                 VALUES (:id, :short_id, :name, :level, :sort_order, :year)
                 ON CONFLICT (id) DO UPDATE SET
@@ -108,180 +377,180 @@ def init_db() -> None:
                     name = EXCLUDED.name,
                     level = EXCLUDED.level,
                     sort_order = EXCLUDED.sort_order;
-            """), {
-                "id": event_id,
-                "short_id": short_id,
-                "name": name,
-                "level": level,
-                "sort_order": idx,
-                "year": LEAGUE_YEAR
-            })
-
+            """), seed)
+            inputs_changed = True
+        _events_cache.clear()
+        _bump_version()
+
+        # Standings views are derived data. Recreate them only when their definition
+        # changed (DROP blocks readers); otherwise refresh if their inputs changed.
+        result = await conn.execute(
+            text("SELECT value FROM schema_meta WHERE key = 'standings_views';")
+        )
+        if result.scalar() != STANDINGS_VIEWS_VERSION:
+            await conn.execute(text("DROP MATERIALIZED VIEW IF EXISTS mv_person_totals;"))
+            await conn.execute(text("DROP MATERIALIZED VIEW IF EXISTS mv_event_breakdown;"))
+            for ddl in STANDINGS_VIEWS_DDL:
+                await conn.execute(text(ddl))
+            await conn.execute(text("""
+                INSERT INTO schema_meta (key, value) VALUES ('standings_views', :v)
+                ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value;
+            """), {"v": STANDINGS_VIEWS_VERSION})
+        elif inputs_changed:
+            await refresh_standings(conn)
 
 
 @app.on_event("startup")
-def startup():
-    init_db()
-
-
-def get_people() -> list[str]:
-    with engine.begin() as conn:
-        rows = conn.execute(text("SELECT name FROM people ORDER BY name;")).fetchall()
-    return [r[0] for r in rows]
-
-
-def get_events():
-    with engine.begin() as conn:
-        rows = conn.execute(
-            text("SELECT id, short_id, name, level FROM events WHERE year=:y ORDER BY id;"),
-            {"y": LEAGUE_YEAR}
-        ).fetchall()
-    # list of dicts for templates
-    return [{"id": r[0], "short_id": r[1], "name": r[2], "level": r[3]} for r in rows]
-
-
-def points_case_sql() -> str:
-    # Build a CASE expression from POINTS dict (keeps logic in one place)
-    parts = [f"WHEN '{rnd}' THEN {pts}" for rnd, pts in POINTS.items()]
-    return "CASE r.round_reached " + " ".join(parts) + " ELSE 0 END"
-
-
-def calc_totals() -> list[tuple[str, int]]:
-    """Total points per person across all events for the year."""
-    case_expr = points_case_sql()
-    with engine.begin() as conn:
-        rows = conn.execute(text(f"""
-        SELECT p.person_name AS person,
-               COALESCE(SUM({case_expr}), 0) AS total
-        FROM predictions p
-        JOIN events e ON e.id = p.event_id
-        LEFT JOIN results r
-          ON r.event_id = p.event_id
-         AND r.player_name = p.player_name
-        WHERE e.year = :year
-        GROUP BY p.person_name
-        ORDER BY total DESC, person ASC;
-        """), {"year": LEAGUE_YEAR}).fetchall()
-    return [(r[0], int(r[1])) for r in rows]
-
-def rank_with_ties(totals: list[tuple[str, int]]) -> list[dict]:
+async def startup():
+    await init_db()
+
+
+async def _get_people(conn) -> list[str]:
+    people = _people_cache.get(LEAGUE_YEAR)
+    if people is None:
+        version = _VERSION
+        result = await conn.execute(SQL_PEOPLE)
+        people = [r[0] for r in result.fetchall()]
+        # A write that committed while we awaited has already cleared the cache;
+        # don't put the pre-write list back.
+        if version == _VERSION:
+            _people_cache[LEAGUE_YEAR] = people
+    return people
+
+
+async def get_people() -> list[str]:
+    # Skip the connection checkout entirely on a cache hit
+    people = _people_cache.get(LEAGUE_YEAR)
+    if people is not None:
+        return people
+    async with engine.connect() as conn:
+        return await _get_people(conn)
+
+
+async def _get_events(conn):
+    events = _events_cache.get(LEAGUE_YEAR)
+    if events is None:
+        version = _VERSION
+        result = await conn.execute(SQL_EVENTS, {"y": LEAGUE_YEAR})
+        rows = result.fetchall()
+        # list of dicts for templates
+        events = [{"id": r[0], "short_id": r[1], "name": r[2], "level": r[3]} for r in rows]
+        if version == _VERSION:  # same guard as _get_people
+            _events_cache[LEAGUE_YEAR] = events
+    return events
+
+
+async def get_events():
+    events = _events_cache.get(LEAGUE_YEAR)
+    if events is not None:
+        return events
+    async with engine.connect() as conn:
+        return await _get_events(conn)
+
+
+async def refresh_standings(conn) -> None:
+    """Refreshes the standings views; call inside the transaction that changed picks/results."""
+    # Separate statement: under READ COMMITTED the REFRESHes below then take their
+    # snapshot after the lock is granted, so they see the previous writer's commit.
+    await conn.execute(SQL_STANDINGS_LOCK, {"k": STANDINGS_LOCK_KEY})
+    await conn.execute(SQL_REFRESH_TOTALS)
+    await conn.execute(SQL_REFRESH_BREAKDOWN)
+
+
+async def _calc_totals(conn) -> list[dict]:
     """
-    Input:  [(person, total_points), ...] sorted DESC by points.
-    Output: [{person, total, rank, medal}, ...] with tie-aware ranks/medals.
-
-    Example ranks: 1, 1, 3, 4...
+    Total points per person across all events for the year, ranked in SQL.
+    Output: [{person, total, rank, medal}, ...]; ties share a rank (1, 1, 3, 4...).
     """
-    ranked = []
-    prev_total = None
-    rank = 0          # displayed rank (1-based)
-    seen = 0          # number of rows processed
-
-    for person, total in totals:
-        seen += 1
-        if prev_total is None or total != prev_total:
-            rank = seen
-            prev_total = total
-
-        if rank == 1:
-            medal = "🥇"
-        elif rank == 2:
-            medal = "🥈"
-        elif rank == 3:
-            medal = "🥉"
-        else:
-            medal = ""
-
-        ranked.append({
-            "person": person,
-            "total": total,
-            "rank": rank,
-            "medal": medal,
-        })
-
-    return ranked
-
-
-def calc_event_breakdown():
+    result = await conn.execute(SQL_TOTALS, {"year": LEAGUE_YEAR})
+    return [
+        {"person": r[0], "total": int(r[1]), "rank": r[2], "medal": MEDALS.get(r[2], "")}
+        for r in result.fetchall()
+    ]
+
+
+async def calc_event_breakdown():
     """
     Returns rows for the home page table:
     event -> person -> (player, round, points)
     """
-    case_expr = points_case_sql()
-    with engine.begin() as conn:
-        rows = conn.execute(text(f"""
-        SELECT e.id AS event_id, e.short_id, e.name,
-               p.person_name, p.player_name,
-               COALESCE(r.round_reached, '') AS round_reached,
-               {case_expr} AS pts
-        FROM predictions p
-        JOIN events e ON e.id = p.event_id
-        LEFT JOIN results r
-          ON r.event_id = p.event_id
-         AND r.player_name = p.player_name
-        WHERE e.year = :year
-        ORDER BY e.sort_order ASC, p.person_name;
-        """), {"year": LEAGUE_YEAR}).fetchall()
-
-    # Group into event blocks
-    events = {}
-    for event_id, short_id, name, person, player, rnd, pts in rows:
-        events.setdefault(event_id, {"event_id": event_id, "short_id": short_id, "name": name, "rows": []})
-        events[event_id]["rows"].append({
-            "person": person,
-            "player": player,
-            "round": rnd or "—",
-            "points": int(pts or 0),
-        })
-    return list(events.values())
+    # Server-side cursor: rows (one per event) are fetched in batches, not all at once
+    async with engine.connect() as conn:
+        result = await conn.stream(SQL_BREAKDOWN, {"year": LEAGUE_YEAR})
+        return [
+            {"event_id": r[0], "short_id": r[1], "name": r[2], "rows": r[3]}
+            async for r in result.yield_per(500)
+        ]
 
 
 @app.get("/", response_class=HTMLResponse)
-def home(request: Request):
-    people = get_people()
-    events = get_events()
-    totals = rank_with_ties(calc_totals())
-
-    return templates.TemplateResponse("home.html", {
+async def home(request: Request):
+    # The home ETag hashes the cached body, so a 304 always matches the content served
+    key = (LEAGUE_YEAR, _VERSION)
+    cached = _home_cache.get(key)
+    if cached is None:
+        cached = _home_cache[key] = await _render_home(request)
+    body, etag = cached
+
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+    return _with_etag(HTMLResponse(body), etag)
+
+
+async def _render_home(request: Request) -> tuple[bytes, str]:
+    # One connection for all home-page reads: a single checkout instead of one per query
+    async with engine.connect() as conn:
+        people = await _get_people(conn)
+        events = await _get_events(conn)
+        totals = await _calc_totals(conn)
+
+    body = templates.TemplateResponse("home.html", {
         "request": request,
         "year": LEAGUE_YEAR,
         "people": people,
         "events": events,
         "totals": totals,
-    })
+    }).body
+    return body, f'W/"{hashlib.sha256(body).hexdigest()[:16]}"'
 
 
 @app.post("/add_person")
-def add_person(name: str = Form(...)):
+async def add_person(name: str = Form(...)):
     name = name.strip()
     if not name:
         raise HTTPException(400, "Name cannot be empty.")
-    with engine.begin() as conn:
-        conn.execute(text("""
-          INSERT INTO people(name) VALUES (:n)
-          ON CONFLICT (name) DO NOTHING;
-        """), {"n": name})
+    async with engine.begin() as conn:
+        await conn.execute(SQL_ADD_PERSON, {"n": name})
+    _people_cache.clear()
+    _bump_version()
     return RedirectResponse("/", status_code=303)
 
 
 @app.get("/picks", response_class=HTMLResponse)
-def picks_page(
+async def picks_page(
     request: Request,
     person: str = Query(default=""),
     event_id: str = Query(default=""),
 ):
-    return templates.TemplateResponse("picks.html", {
+    etag = _etag()
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    return _with_etag(templates.TemplateResponse("picks.html", {
         "request": request,
         "year": LEAGUE_YEAR,
-        "people": get_people(),
-        "events": get_events(),
+        "people": await get_people(),
+        "events": await get_events(),
         "selected_person": person,
         "selected_event_id": event_id,
-    })
+    }), etag)
 
 
 
 @app.post("/picks")
-def submit_pick(
+async def submit_pick(
     person: str = Form(...),
     event_id: str = Form(...),
     player: str = Form(...),
@@ -293,50 +562,58 @@ def submit_pick(
     if not (person and event_id and player):
         raise HTTPException(400, "Missing fields.")
 
-    with engine.begin() as conn:
+    async with engine.begin() as conn:
         # Ensure person exists (helps avoid “someone forgot to add Mom” errors)
-        conn.execute(text("INSERT INTO people(name) VALUES (:n) ON CONFLICT (name) DO NOTHING;"), {"n": person})
+        await conn.execute(SQL_ADD_PERSON, {"n": person})
 
         # Upsert prediction (one pick per person per event)
-        conn.execute(text("""
-          INSERT INTO predictions(event_id, person_name, player_name)
-          VALUES (:e, :p, :pl)
-          ON CONFLICT (event_id, person_name)
-          DO UPDATE SET player_name = excluded.player_name;
-        """), {"e": event_id, "p": person, "pl": player})
+        await conn.execute(SQL_UPSERT_PICK, {"e": event_id, "p": person, "pl": player})
+        await refresh_standings(conn)
+    _people_cache.clear()
+    _bump_version()
 
     qs = urlencode({"person": person, "event_id": event_id})
     return RedirectResponse(f"/picks?{qs}", status_code=303)
 
 @app.get("/breakdown", response_class=HTMLResponse)
-def breakdown_page(request: Request, event_id: Optional[str] = Query(default=None)):
-    events = get_events()  
-    breakdown = calc_event_breakdown()
+async def breakdown_page(request: Request, event_id: Optional[str] = Query(default=None)):
+    etag = _etag()
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    events = await get_events()  
+    breakdown = await calc_event_breakdown()
 
     # Filter to one event if selected
     if event_id:
         breakdown = [ev for ev in breakdown if ev["event_id"] == event_id]
 
-    return templates.TemplateResponse("breakdown.html", {
+    return _with_etag(templates.TemplateResponse("breakdown.html", {
         "request": request,
         "year": LEAGUE_YEAR,
         "events": events,                     
         "selected_event_id": event_id or "",  
         "breakdown": breakdown,
-    })
+    }), etag)
 
 @app.get("/results", response_class=HTMLResponse)
-def results_page(request: Request):
-    return templates.TemplateResponse("results.html", {
+async def results_page(request: Request):
+    etag = _etag()
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    return _with_etag(templates.TemplateResponse("results.html", {
         "request": request,
         "year": LEAGUE_YEAR,
-        "events": get_events(),
+        "events": await get_events(),
         "rounds": ALLOWED_ROUNDS,
-    })
+    }), etag)
 
 
 @app.post("/results")
-def submit_result(
+async def submit_result(
     commissioner_key: str = Form(...),
     event_id: str = Form(...),
     player: str = Form(...),
@@ -349,15 +626,57 @@ def submit_result(
     player = player.strip()
     round_reached = round_reached.strip().upper()
 
-    if round_reached not in ALLOWED_ROUNDS:
-        raise HTTPException(400, f"Invalid round. Use one of: {ALLOWED_ROUNDS}")
+    if round_reached not in _ALLOWED_ROUNDS_SET:
+        raise HTTPException(400, f"Invalid round. Use one of: {', '.join(ALLOWED_ROUNDS)}")
 
-    with engine.begin() as conn:
-        conn.execute(text("""
-          INSERT INTO results(event_id, player_name, round_reached)
-          VALUES (:e, :pl, :r)
-          ON CONFLICT (event_id, player_name)
-          DO UPDATE SET round_reached = excluded.round_reached;
-        """), {"e": event_id, "pl": player, "r": round_reached})
+    async with engine.begin() as conn:
+        await conn.execute(SQL_UPSERT_RESULT, {"e": event_id, "pl": player, "r": round_reached})
+        await refresh_standings(conn)
+    _bump_version()
 
     return RedirectResponse("/results", status_code=303)
+
+
+class ResultRow(BaseModel):
+    event_id: str
+    player: str
+    round_reached: str
+
+
+class ResultBatch(BaseModel):
+    commissioner_key: str
+    results: list[ResultRow]
+
+
+@app.post("/results/batch")
+async def submit_results_batch(batch: ResultBatch):
+    """Saves a whole draw's results in one request and one executemany round-trip."""
+    if batch.commissioner_key != COMMISSIONER_KEY:
+        raise HTTPException(403, "Wrong commissioner key.")
+
+    params = [
+        {"e": row.event_id.strip(), "pl": row.player.strip(), "r": row.round_reached.strip().upper()}
+        for row in batch.results
+    ]
+    if not params:
+        raise HTTPException(400, "No results to save.")
+
+    # Check every row up front so one typo is a 400 naming it, not a FK error for the batch
+    event_ids = {ev["id"] for ev in await get_events()}
+    errors = []
+    for i, p in enumerate(params, start=1):
+        if not p["e"] or not p["pl"]:
+            errors.append(f"row {i}: event_id and player are required")
+        elif p["e"] not in event_ids:
+            errors.append(f"row {i}: unknown event_id {p['e']!r}")
+        elif p["r"] not in _ALLOWED_ROUNDS_SET:
+            errors.append(f"row {i}: invalid round {p['r']!r} (use one of: {', '.join(ALLOWED_ROUNDS)})")
+    if errors:
+        raise HTTPException(400, "Invalid results: " + "; ".join(errors))
+
+    async with engine.begin() as conn:
+        await conn.execute(SQL_UPSERT_RESULT, params)
+        await refresh_standings(conn)
+    _bump_version()
+
+    return {"saved": len(params)}